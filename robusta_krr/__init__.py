@@ -1,4 +1,15 @@
-from .main import run
+from typing import Any
 
 __version__ = "dev"
 __all__ = ["run", "__version__"]
+
+
+# NOTE: `run` is resolved lazily (PEP 562), so importing `robusta_krr` (e.g. for `robusta_krr.api`)
+#       does not load the CLI and its dependencies.
+def __getattr__(name: str) -> Any:
+    if name == "run":
+        from .main import run
+
+        return run
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,13 +1,26 @@
 from __future__ import annotations
 
-from typing import Any, Callable, Optional
+from typing import TYPE_CHECKING, Any, Callable, Optional
 
-from robusta_krr.core.models.result import Result
+if TYPE_CHECKING:
+    from robusta_krr.core.models.result import Result
 
-FormatterFunc = Callable[[Result], Any]
+FormatterFunc = Callable[["Result"], Any]
 
 FORMATTERS_REGISTRY: dict[str, FormatterFunc] = {}
 
+# NOTE: Built-in formatters are registered lazily, as some of them are heavy to import (rich, yaml, ...)
+#       and only one formatter is used per run. This maps their names to their modules in `robusta_krr.formatters`,
+#       which are imported only when the formatter is looked up.
+BUILTIN_FORMATTERS: dict[str, str] = {
+    "json": "json",
+    "pprint": "pprint",
+    "table": "table",
+    "yaml": "yaml",
+    "csv": "csv",
+    "html": "html",
+}
+
 
 # NOTE: Here asterisk is used to make the argument `rich_console` keyword-only
 #       This is done to avoid the following usage, where it is unclear what the boolean value is for:
@@ -62,6 +75,11 @@ def find(name: str) -> FormatterFunc:
         ValueError: If a formatter with the given name does not exist.
     """
 
+    from robusta_krr import formatters as concrete_formatters
+
+    if name not in FORMATTERS_REGISTRY and name in BUILTIN_FORMATTERS:
+        getattr(concrete_formatters, name)  # NOTE: imports the module of the built-in formatter, registering it
+
     try:
         return FORMATTERS_REGISTRY[name]
     except KeyError as e:
@@ -70,13 +88,13 @@ def find(name: str) -> FormatterFunc:
 
 def list_available() -> list[str]:
     """
-    List available formatters in the registry.
+    List available formatters: the built-in ones, which are not imported by this, and the registered ones.
 
     Returns:
     list[str]: A list of the names of the available formatters.
     """
 
-    return list(FORMATTERS_REGISTRY)
+    return list(dict.fromkeys([*BUILTIN_FORMATTERS, *FORMATTERS_REGISTRY]))
 
 
 __all__ = ["register", "find"]
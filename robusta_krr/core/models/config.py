@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import logging
 import sys
-from typing import Any, Literal, Optional, Union
+from typing import TYPE_CHECKING, Any, Literal, Optional, Union
 
 import pydantic as pd
 from kubernetes import config
@@ -11,9 +11,11 @@ from rich.console import Console
 from rich.logging import RichHandler
 
 from robusta_krr.core.abstract import formatters
-from robusta_krr.core.abstract.strategies import AnyStrategy, BaseStrategy
 from robusta_krr.core.models.objects import KindLiteral
 
+if TYPE_CHECKING:
+    from robusta_krr.core.abstract.strategies import AnyStrategy
+
 logger = logging.getLogger("krr")
 
 
@@ -119,18 +121,25 @@ class Config(pd.BaseSettings):
         return [next(r for r in KindLiteral.__args__ if r.lower() == val.lower()) for val in v]
 
     def create_strategy(self) -> AnyStrategy:
-        StrategyType = AnyStrategy.find(self.strategy)
+        # NOTE: Strategies are imported here, as they import the result models, which import this module
+        from robusta_krr.core.abstract.strategies import BaseStrategy
+
+        StrategyType = BaseStrategy.find(self.strategy)
         StrategySettingsType = StrategyType.get_settings_type()
         return StrategyType(StrategySettingsType(**self.other_args))  # type: ignore
 
     @pd.validator("strategy")
     def validate_strategy(cls, v: str) -> str:
+        from robusta_krr.core.abstract.strategies import BaseStrategy
+
         BaseStrategy.find(v)  # NOTE: raises if strategy is not found
         return v
 
     @pd.validator("format")
     def validate_format(cls, v: str) -> str:
-        formatters.find(v)  # NOTE: raises if strategy is not found
+        # NOTE: The formatter itself is imported only when the result is formatted
+        if v not in formatters.list_available():
+            raise ValueError(f"Formatter '{v}' not found")
         return v
 
     @property
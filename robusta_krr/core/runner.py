@@ -1,4 +1,5 @@
 import asyncio
+import functools
 import logging
 import math
 import os
@@ -7,6 +8,8 @@ import warnings
 from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Union
 from datetime import timedelta, datetime
+
+import urllib3
 from prometrix import PrometheusNotFound
 from rich.console import Console
 from slack_sdk import WebClient
@@ -37,10 +40,18 @@ def custom_print(*objects, rich: bool = True, force: bool = False) -> None:
 class CriticalRunnerException(Exception): ...
 
 
+@functools.lru_cache(maxsize=None)
+def disable_insecure_request_warnings() -> None:
+    # NOTE: Disable insecure request warnings, as it might be expected to use self-signed certificates inside the cluster
+    urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+
+
 class Runner:
     EXPECTED_EXCEPTIONS = (KeyboardInterrupt, PrometheusNotFound)
 
     def __init__(self) -> None:
+        disable_insecure_request_warnings()
+
         self._k8s_loader = KubernetesLoader()
         self._metrics_service_loaders: dict[Optional[str], Union[PrometheusMetricsLoader, Exception]] = {}
         self._metrics_service_loaders_error_logged: set[Exception] = set()
@@ -1,6 +1,26 @@
-from .json import json
-from .pprint import pprint
-from .table import table
-from .yaml import yaml
-from .csv import csv
-from .html import html
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+from robusta_krr.core.abstract.formatters import BUILTIN_FORMATTERS, FORMATTERS_REGISTRY
+
+if TYPE_CHECKING:
+    from .csv import csv_exporter as csv
+    from .html import html
+    from .json import json
+    from .pprint import pprint
+    from .table import table
+    from .yaml import yaml
+
+
+# NOTE: Formatter modules are imported on first access, see `BUILTIN_FORMATTERS`
+def __getattr__(name: str) -> Any:
+    try:
+        module_name = BUILTIN_FORMATTERS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    importlib.import_module(f".{module_name}", __name__)
+    globals()[name] = FORMATTERS_REGISTRY[name]
+    return FORMATTERS_REGISTRY[name]
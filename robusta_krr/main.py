@@ -1,24 +1,31 @@
 from __future__ import annotations
 
 import asyncio
+import atexit
+import functools
 import inspect
 import logging
+import os
+import sys
 from datetime import datetime
-from typing import List, Optional
+from typing import TYPE_CHECKING, Any, Coroutine, List, Optional, Union, get_args, get_origin
 from uuid import UUID
 
 import click
 import typer
-import urllib3
-from pydantic import ValidationError  # noqa: F401
-from typer.models import OptionInfo
 
-from robusta_krr import formatters as concrete_formatters  # noqa: F401
-from robusta_krr.core.abstract import formatters
-from robusta_krr.core.abstract.strategies import BaseStrategy
-from robusta_krr.core.models.config import Config
-from robusta_krr.core.runner import Runner
-from robusta_krr.utils.version import get_version
+if TYPE_CHECKING:
+    from pydantic.fields import ModelField
+
+    from robusta_krr.core.abstract.strategies import BaseStrategy, StrategySettings
+
+# NOTE: Heavy imports (kubernetes, prometheus, formatters, ...) are done inside the functions that need them.
+#       Only `krr version` skips them entirely: `krr --help` and shell completion still list the strategies,
+#       and importing the strategies loads the prometheus integration (kubernetes, prometrix, numpy, pydantic).
+#       `rich` is the exception: typer imports it by itself when it is installed, whatever `rich_help_panel` is,
+#       so the help panels are always set (hiding them on non-TTY output would not spare the import).
+
+_STRATEGY_HELP = "Run KRR using the `{}` strategy"
 
 app = typer.Typer(
     pretty_exceptions_show_locals=False,
@@ -27,325 +34,542 @@ app = typer.Typer(
     help="IMPORTANT: Run `krr simple --help` to see all cli flags!",
 )
 
-# NOTE: Disable insecure request warnings, as it might be expected to use self-signed certificates inside the cluster
-urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
-
-logger = logging.getLogger("krr")
-
 
 @app.command(rich_help_panel="Utils")
 def version() -> None:
+    from robusta_krr.utils.version import get_version
+
     typer.echo(get_version())
 
 
+_LITERAL_TYPES = frozenset({int, float, str, bool, datetime, UUID})
+
+
+@functools.lru_cache(maxsize=None)
 def __process_type(_T: type) -> type:
     """Process type to a python literal"""
-    if _T in (int, float, str, bool, datetime, UUID):
+    if _T in _LITERAL_TYPES:
         return _T
-    elif _T is Optional:
-        return Optional[{__process_type(_T.__args__[0])}]  # type: ignore
+    elif get_origin(_T) is Union and type(None) in get_args(_T):
+        return Optional[__process_type(next(arg for arg in get_args(_T) if arg is not type(None)))]  # type: ignore
     else:
         return str  # If the type is unknown, just use str and let pydantic handle it
 
 
-def load_commands() -> None:
-    for strategy_name, strategy_type in BaseStrategy.get_all().items():  # type: ignore
-        # NOTE: This wrapper here is needed to avoid the strategy_name being overwritten in the loop
-        def strategy_wrapper(_strategy_name: str = strategy_name):
-            def run_strategy(
-                ctx: typer.Context,
-                kubeconfig: Optional[str] = typer.Option(
-                    None,
-                    "--kubeconfig",
-                    "-k",
-                    help="Path to kubeconfig file. If not provided, will attempt to find it.",
-                    rich_help_panel="Kubernetes Settings",
-                ),
-                impersonate_user: Optional[str] = typer.Option(
-                    None,
-                    "--as",
-                    help="Impersonate a user, just like `kubectl --as`. For example, system:serviceaccount:default:krr-account.",
-                    rich_help_panel="Kubernetes Settings",
-                ),
-                impersonate_group: Optional[str] = typer.Option(
-                    None,
-                    "--as-group",
-                    help="Impersonate a user inside of a group, just like `kubectl --as-group`. For example, system:authenticated.",
-                    rich_help_panel="Kubernetes Settings",
-                ),
-                clusters: List[str] = typer.Option(
-                    None,
-                    "--context",
-                    "--cluster",
-                    "-c",
-                    help="List of clusters to run on. By default, will run on the current cluster. Use --all-clusters to run on all clusters.",
-                    rich_help_panel="Kubernetes Settings",
-                ),
-                all_clusters: bool = typer.Option(
-                    False,
-                    "--all-clusters",
-                    help="Run on all clusters. Overrides --context.",
-                    rich_help_panel="Kubernetes Settings",
-                ),
-                namespaces: List[str] = typer.Option(
-                    None,
-                    "--namespace",
-                    "-n",
-                    help="List of namespaces to run on. By default, will run on all namespaces except 'kube-system'.",
-                    rich_help_panel="Kubernetes Settings",
-                ),
-                resources: List[str] = typer.Option(
-                    None,
-                    "--resource",
-                    "-r",
-                    help="List of resources to run on (Deployment, StatefulSet, DaemonSet, Job, Rollout, StrimziPodSet). By default, will run on all resources. Case insensitive.",
-                    rich_help_panel="Kubernetes Settings",
-                ),
-                selector: Optional[str] = typer.Option(
-                    None,
-                    "--selector",
-                    "-s",
-                    help="Selector (label query) to filter workloads. Applied to labels on the workload (e.g. deployment) not on the individual pod! Supports '=', '==', and '!='.(e.g. -s key1=value1,key2=value2). Matching objects must satisfy all of the specified label constraints.",
-                    rich_help_panel="Kubernetes Settings",
-                ),
-                prometheus_url: Optional[str] = typer.Option(
-                    None,
-                    "--prometheus-url",
-                    "-p",
-                    help="Prometheus URL. If not provided, will attempt to find it in kubernetes cluster",
-                    rich_help_panel="Prometheus Settings",
-                ),
-                prometheus_auth_header: Optional[str] = typer.Option(
-                    None,
-                    "--prometheus-auth-header",
-                    help="Prometheus authentication header.",
-                    rich_help_panel="Prometheus Settings",
-                ),
-                prometheus_other_headers: Optional[List[str]] = typer.Option(
-                    None,
-                    "--prometheus-headers",
-                    "-H",
-                    help="Additional headers to add to Prometheus requests. Format as 'key: value', for example 'X-MyHeader: 123'. Trailing whitespaces will be stripped.",
-                    rich_help_panel="Prometheus Settings",
-                ),
-                prometheus_ssl_enabled: bool = typer.Option(
-                    False,
-                    "--prometheus-ssl-enabled",
-                    help="Enable SSL for Prometheus requests.",
-                    rich_help_panel="Prometheus Settings",
-                ),
-                prometheus_cluster_label: Optional[str] = typer.Option(
-                    None,
-                    "--prometheus-cluster-label",
-                    "-l",
-                    help="The label in prometheus for your cluster.(Only relevant for centralized prometheus)",
-                    rich_help_panel="Prometheus Settings",
-                ),
-                prometheus_label: str = typer.Option(
-                    None,
-                    "--prometheus-label",
-                    help="The label in prometheus used to differentiate clusters. (Only relevant for centralized prometheus)",
-                    rich_help_panel="Prometheus Settings",
-                ),
-                eks_managed_prom: bool = typer.Option(
-                    False,
-                    "--eks-managed-prom",
-                    help="Adds additional signitures for eks prometheus connection.",
-                    rich_help_panel="Prometheus EKS Settings",
-                ),
-                eks_managed_prom_profile_name: Optional[str] = typer.Option(
-                    None,
-                    "--eks-profile-name",
-                    help="Sets the profile name for eks prometheus connection.",
-                    rich_help_panel="Prometheus EKS Settings",
-                ),
-                eks_access_key: Optional[str] = typer.Option(
-                    None,
-                    "--eks-access-key",
-                    help="Sets the access key for eks prometheus connection.",
-                    rich_help_panel="Prometheus EKS Settings",
-                ),
-                eks_secret_key: Optional[str] = typer.Option(
-                    None,
-                    "--eks-secret-key",
-                    help="Sets the secret key for eks prometheus connection.",
-                    rich_help_panel="Prometheus EKS Settings",
-                ),
-                eks_service_name: Optional[str] = typer.Option(
-                    "aps",
-                    "--eks-service-name",
-                    help="Sets the service name for eks prometheus connection.",
-                    rich_help_panel="Prometheus EKS Settings",
-                ),
-                eks_managed_prom_region: Optional[str] = typer.Option(
-                    None,
-                    "--eks-managed-prom-region",
-                    help="Sets the region for eks prometheus connection.",
-                    rich_help_panel="Prometheus EKS Settings",
-                ),
-                coralogix_token: Optional[str] = typer.Option(
-                    None,
-                    "--coralogix-token",
-                    help="Adds the token needed to query Coralogix managed prometheus.",
-                    rich_help_panel="Prometheus Coralogix Settings",
-                ),
-                openshift: bool = typer.Option(
-                    False,
-                    "--openshift",
-                    help="Connect to Prometheus with a token read from /var/run/secrets/kubernetes.io/serviceaccount/token - recommended when running KRR inside an OpenShift cluster",
-                    rich_help_panel="Prometheus Openshift Settings",
-                ),
-                cpu_min_value: int = typer.Option(
-                    10,
-                    "--cpu-min",
-                    help="Sets the minimum recommended cpu value in millicores.",
-                    rich_help_panel="Recommendation Settings",
-                ),
-                memory_min_value: int = typer.Option(
-                    100,
-                    "--mem-min",
-                    help="Sets the minimum recommended memory value in MB.",
-                    rich_help_panel="Recommendation Settings",
-                ),
-                max_workers: int = typer.Option(
-                    10,
-                    "--max-workers",
-                    "-w",
-                    help="Max workers to use for async requests.",
-                    rich_help_panel="Threading Settings",
-                ),
-                format: str = typer.Option(
-                    "table",
-                    "--formatter",
-                    "-f",
-                    help=f"Output formatter ({', '.join(formatters.list_available())})",
-                    rich_help_panel="Logging Settings",
-                ),
-                show_cluster_name: bool = typer.Option(
-                    False,
-                    "--show-cluster-name",
-                    help="In table output, always show the cluster name even for a single cluster",
-                    rich_help_panel="Output Settings",
-                ),
-                show_severity: bool = typer.Option(
-                    True,
-                    " /--exclude-severity",
-                    help="Whether to include the severity in the output or not",
-                    rich_help_panel="Output Settings",
-                ),
-                verbose: bool = typer.Option(
-                    False, "--verbose", "-v", help="Enable verbose mode", rich_help_panel="Logging Settings"
-                ),
-                quiet: bool = typer.Option(
-                    False, "--quiet", "-q", help="Enable quiet mode", rich_help_panel="Logging Settings"
-                ),
-                log_to_stderr: bool = typer.Option(
-                    False, "--logtostderr", help="Pass logs to stderr", rich_help_panel="Logging Settings"
-                ),
-                width: Optional[int] = typer.Option(
-                    None,
-                    "--width",
-                    help="Width of the output. Will use console width by default.",
-                    rich_help_panel="Logging Settings",
-                ),
-                file_output: Optional[str] = typer.Option(
-                    None,
-                    "--fileoutput",
-                    help="Filename to write output to (if not specified, file output is disabled)",
-                    rich_help_panel="Output Settings",
-                ),
-                file_output_dynamic: bool = typer.Option(
-                    False,
-                    "--fileoutput-dynamic",
-                    help="Ignore --fileoutput and write files to the current directory in the format krr-{datetime}.{format} (e.g. krr-20240518223924.csv)",
-                    rich_help_panel="Output Settings",
-                ),
-                slack_output: Optional[str] = typer.Option(
-                    None,
-                    "--slackoutput",
-                    help="Send to output to a slack channel, must have SLACK_BOT_TOKEN",
-                    rich_help_panel="Output Settings",
-                ),
-                **strategy_args,
-            ) -> None:
-                f"""Run KRR using the `{_strategy_name}` strategy"""
-                if not show_severity and format != "csv":
-                    raise click.BadOptionUsage("--exclude-severity", "--exclude-severity works only with format=csv")
-
-                try:
-                    config = Config(
-                        kubeconfig=kubeconfig,
-                        impersonate_user=impersonate_user,
-                        impersonate_group=impersonate_group,
-                        clusters="*" if all_clusters else clusters,
-                        namespaces="*" if "*" in namespaces else namespaces,
-                        resources="*" if "*" in resources else resources,
-                        selector=selector,
-                        prometheus_url=prometheus_url,
-                        prometheus_auth_header=prometheus_auth_header,
-                        prometheus_other_headers=prometheus_other_headers,
-                        prometheus_ssl_enabled=prometheus_ssl_enabled,
-                        prometheus_cluster_label=prometheus_cluster_label,
-                        prometheus_label=prometheus_label,
-                        eks_managed_prom=eks_managed_prom,
-                        eks_managed_prom_region=eks_managed_prom_region,
-                        eks_managed_prom_profile_name=eks_managed_prom_profile_name,
-                        eks_access_key=eks_access_key,
-                        eks_secret_key=eks_secret_key,
-                        eks_service_name=eks_service_name,
-                        coralogix_token=coralogix_token,
-                        openshift=openshift,
-                        max_workers=max_workers,
-                        format=format,
-                        show_cluster_name=show_cluster_name,
-                        verbose=verbose,
-                        cpu_min_value=cpu_min_value,
-                        memory_min_value=memory_min_value,
-                        quiet=quiet,
-                        log_to_stderr=log_to_stderr,
-                        width=width,
-                        file_output=file_output,
-                        file_output_dynamic=file_output_dynamic,
-                        slack_output=slack_output,
-                        show_severity=show_severity,
-                        strategy=_strategy_name,
-                        other_args=strategy_args,
-                    )
-                    Config.set_config(config)
-                except ValidationError:
-                    logger.exception("Error occured while parsing arguments")
-                else:
-                    runner = Runner()
-                    exit_code = asyncio.run(runner.run())
-                    raise typer.Exit(code=exit_code)
-
-            run_strategy.__name__ = strategy_name
-            signature = inspect.signature(run_strategy)
-            run_strategy.__signature__ = signature.replace(  # type: ignore
-                parameters=list(signature.parameters.values())[:-1]
-                + [
-                    inspect.Parameter(
-                        name=field_name,
-                        kind=inspect.Parameter.KEYWORD_ONLY,
-                        default=OptionInfo(
-                            default=field_meta.default,
-                            param_decls=list(set([f"--{field_name}", f"--{field_name.replace('_', '-')}"])),
-                            help=f"{field_meta.field_info.description}",
-                            rich_help_panel="Strategy Settings",
-                        ),
-                        annotation=__process_type(field_meta.type_),
-                    )
-                    for field_name, field_meta in strategy_type.get_settings_type().__fields__.items()
-                ]
-            )
-
-            app.command(rich_help_panel="Strategies")(run_strategy)
-
-        strategy_wrapper()
+@functools.lru_cache(maxsize=None)
+def _get_all_strategies() -> dict[str, type[BaseStrategy]]:
+    from robusta_krr.core.abstract.strategies import BaseStrategy
+
+    return BaseStrategy.get_all()  # type: ignore
+
+
+@functools.lru_cache(maxsize=None)
+def _get_strategy_fields(settings_type: type[StrategySettings]) -> tuple[tuple[str, ModelField], ...]:
+    return tuple(settings_type.__fields__.items())
+
+
+def clear_caches() -> None:
+    """
+    Clear the cached strategies and generated parameters,
+    e.g. when strategies or formatters are added after the commands were first loaded.
+    """
+
+    _get_all_strategies.cache_clear()
+    _formatters_help.cache_clear()
+    _common_parameters.cache_clear()
+    _get_strategy_fields.cache_clear()
+    _strategy_parameter.cache_clear()
+    _strategy_parameters.cache_clear()
+
+
+def _strategy_stub() -> None:
+    pass
+
+
+def load_command_stubs() -> None:
+    """Register the strategies as empty commands, which is enough to list them in the help."""
+
+    for strategy_name in _get_all_strategies():
+        app.command(name=strategy_name, help=_STRATEGY_HELP.format(strategy_name), rich_help_panel="Strategies")(
+            _strategy_stub
+        )
+
+
+# NOTE: `asyncio.Runner` only exists on Python 3.11+
+if sys.version_info >= (3, 11):
+    _RUNNER_LOOP: Optional[asyncio.Runner] = None
+
+    def _get_runner_loop() -> asyncio.Runner:
+        """The event loop shared by all the runs in the process (Python 3.11+), closed at exit."""
+
+        global _RUNNER_LOOP
+
+        if _RUNNER_LOOP is None:
+            try:
+                import uvloop
+            except ImportError:
+                _RUNNER_LOOP = asyncio.Runner()
+            else:
+                _RUNNER_LOOP = asyncio.Runner(loop_factory=uvloop.new_event_loop)
+            atexit.register(_RUNNER_LOOP.close)
+
+        return _RUNNER_LOOP
+
+
+def _run_async(main: Coroutine[Any, Any, int]) -> int:
+    """Run the coroutine in the event loop, using uvloop if it is installed."""
+
+    if sys.version_info >= (3, 11):
+        return _get_runner_loop().run(main)
+
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(main)
+
+    uvloop.install()
+    return asyncio.run(main)
+
+
+def _option(name: str, annotation: Any, default: Any, *param_decls: str, **kwargs: Any) -> inspect.Parameter:
+    return inspect.Parameter(
+        name=name,
+        kind=inspect.Parameter.KEYWORD_ONLY,
+        default=typer.Option(default, *param_decls, **kwargs),
+        annotation=annotation,
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _formatters_help() -> str:
+    from robusta_krr.core.abstract import formatters
+
+    return f"Output formatter ({', '.join(formatters.list_available())})"
+
+
+@functools.lru_cache(maxsize=None)
+def _common_parameters() -> tuple[inspect.Parameter, ...]:
+    """Build the parameters shared by all the strategy commands, once for all the strategies."""
+
+    return (
+        inspect.Parameter(name="ctx", kind=inspect.Parameter.POSITIONAL_OR_KEYWORD, annotation=typer.Context),
+        _option(
+            "kubeconfig",
+            Optional[str],
+            None,
+            "--kubeconfig",
+            "-k",
+            help="Path to kubeconfig file. If not provided, will attempt to find it.",
+            rich_help_panel="Kubernetes Settings",
+        ),
+        _option(
+            "impersonate_user",
+            Optional[str],
+            None,
+            "--as",
+            help="Impersonate a user, just like `kubectl --as`. For example, system:serviceaccount:default:krr-account.",
+            rich_help_panel="Kubernetes Settings",
+        ),
+        _option(
+            "impersonate_group",
+            Optional[str],
+            None,
+            "--as-group",
+            help="Impersonate a user inside of a group, just like `kubectl --as-group`. For example, system:authenticated.",
+            rich_help_panel="Kubernetes Settings",
+        ),
+        _option(
+            "clusters",
+            List[str],
+            None,
+            "--context",
+            "--cluster",
+            "-c",
+            help="List of clusters to run on. By default, will run on the current cluster. Use --all-clusters to run on all clusters.",
+            rich_help_panel="Kubernetes Settings",
+        ),
+        _option(
+            "all_clusters",
+            bool,
+            False,
+            "--all-clusters",
+            help="Run on all clusters. Overrides --context.",
+            rich_help_panel="Kubernetes Settings",
+        ),
+        _option(
+            "namespaces",
+            List[str],
+            None,
+            "--namespace",
+            "-n",
+            help="List of namespaces to run on. By default, will run on all namespaces except 'kube-system'.",
+            rich_help_panel="Kubernetes Settings",
+        ),
+        _option(
+            "resources",
+            List[str],
+            None,
+            "--resource",
+            "-r",
+            help="List of resources to run on (Deployment, StatefulSet, DaemonSet, Job, Rollout, StrimziPodSet). By default, will run on all resources. Case insensitive.",
+            rich_help_panel="Kubernetes Settings",
+        ),
+        _option(
+            "selector",
+            Optional[str],
+            None,
+            "--selector",
+            "-s",
+            help="Selector (label query) to filter workloads. Applied to labels on the workload (e.g. deployment) not on the individual pod! Supports '=', '==', and '!='.(e.g. -s key1=value1,key2=value2). Matching objects must satisfy all of the specified label constraints.",
+            rich_help_panel="Kubernetes Settings",
+        ),
+        _option(
+            "prometheus_url",
+            Optional[str],
+            None,
+            "--prometheus-url",
+            "-p",
+            help="Prometheus URL. If not provided, will attempt to find it in kubernetes cluster",
+            rich_help_panel="Prometheus Settings",
+        ),
+        _option(
+            "prometheus_auth_header",
+            Optional[str],
+            None,
+            "--prometheus-auth-header",
+            help="Prometheus authentication header.",
+            rich_help_panel="Prometheus Settings",
+        ),
+        _option(
+            "prometheus_other_headers",
+            Optional[List[str]],
+            None,
+            "--prometheus-headers",
+            "-H",
+            help="Additional headers to add to Prometheus requests. Format as 'key: value', for example 'X-MyHeader: 123'. Trailing whitespaces will be stripped.",
+            rich_help_panel="Prometheus Settings",
+        ),
+        _option(
+            "prometheus_ssl_enabled",
+            bool,
+            False,
+            "--prometheus-ssl-enabled",
+            help="Enable SSL for Prometheus requests.",
+            rich_help_panel="Prometheus Settings",
+        ),
+        _option(
+            "prometheus_cluster_label",
+            Optional[str],
+            None,
+            "--prometheus-cluster-label",
+            "-l",
+            help="The label in prometheus for your cluster.(Only relevant for centralized prometheus)",
+            rich_help_panel="Prometheus Settings",
+        ),
+        _option(
+            "prometheus_label",
+            str,
+            None,
+            "--prometheus-label",
+            help="The label in prometheus used to differentiate clusters. (Only relevant for centralized prometheus)",
+            rich_help_panel="Prometheus Settings",
+        ),
+        _option(
+            "eks_managed_prom",
+            bool,
+            False,
+            "--eks-managed-prom",
+            help="Adds additional signitures for eks prometheus connection.",
+            rich_help_panel="Prometheus EKS Settings",
+        ),
+        _option(
+            "eks_managed_prom_profile_name",
+            Optional[str],
+            None,
+            "--eks-profile-name",
+            help="Sets the profile name for eks prometheus connection.",
+            rich_help_panel="Prometheus EKS Settings",
+        ),
+        _option(
+            "eks_access_key",
+            Optional[str],
+            None,
+            "--eks-access-key",
+            help="Sets the access key for eks prometheus connection.",
+            rich_help_panel="Prometheus EKS Settings",
+        ),
+        _option(
+            "eks_secret_key",
+            Optional[str],
+            None,
+            "--eks-secret-key",
+            help="Sets the secret key for eks prometheus connection.",
+            rich_help_panel="Prometheus EKS Settings",
+        ),
+        _option(
+            "eks_service_name",
+            Optional[str],
+            "aps",
+            "--eks-service-name",
+            help="Sets the service name for eks prometheus connection.",
+            rich_help_panel="Prometheus EKS Settings",
+        ),
+        _option(
+            "eks_managed_prom_region",
+            Optional[str],
+            None,
+            "--eks-managed-prom-region",
+            help="Sets the region for eks prometheus connection.",
+            rich_help_panel="Prometheus EKS Settings",
+        ),
+        _option(
+            "coralogix_token",
+            Optional[str],
+            None,
+            "--coralogix-token",
+            help="Adds the token needed to query Coralogix managed prometheus.",
+            rich_help_panel="Prometheus Coralogix Settings",
+        ),
+        _option(
+            "openshift",
+            bool,
+            False,
+            "--openshift",
+            help="Connect to Prometheus with a token read from /var/run/secrets/kubernetes.io/serviceaccount/token - recommended when running KRR inside an OpenShift cluster",
+            rich_help_panel="Prometheus Openshift Settings",
+        ),
+        _option(
+            "cpu_min_value",
+            int,
+            10,
+            "--cpu-min",
+            help="Sets the minimum recommended cpu value in millicores.",
+            rich_help_panel="Recommendation Settings",
+        ),
+        _option(
+            "memory_min_value",
+            int,
+            100,
+            "--mem-min",
+            help="Sets the minimum recommended memory value in MB.",
+            rich_help_panel="Recommendation Settings",
+        ),
+        _option(
+            "max_workers",
+            int,
+            10,
+            "--max-workers",
+            "-w",
+            help="Max workers to use for async requests.",
+            rich_help_panel="Threading Settings",
+        ),
+        _option(
+            "format",
+            str,
+            "table",
+            "--formatter",
+            "-f",
+            help=_formatters_help(),
+            rich_help_panel="Logging Settings",
+        ),
+        _option(
+            "show_cluster_name",
+            bool,
+            False,
+            "--show-cluster-name",
+            help="In table output, always show the cluster name even for a single cluster",
+            rich_help_panel="Output Settings",
+        ),
+        _option(
+            "show_severity",
+            bool,
+            True,
+            " /--exclude-severity",
+            help="Whether to include the severity in the output or not",
+            rich_help_panel="Output Settings",
+        ),
+        _option(
+            "verbose",
+            bool,
+            False,
+            "--verbose",
+            "-v",
+            help="Enable verbose mode",
+            rich_help_panel="Logging Settings",
+        ),
+        _option(
+            "quiet",
+            bool,
+            False,
+            "--quiet",
+            "-q",
+            help="Enable quiet mode",
+            rich_help_panel="Logging Settings",
+        ),
+        _option(
+            "log_to_stderr",
+            bool,
+            False,
+            "--logtostderr",
+            help="Pass logs to stderr",
+            rich_help_panel="Logging Settings",
+        ),
+        _option(
+            "width",
+            Optional[int],
+            None,
+            "--width",
+            help="Width of the output. Will use console width by default.",
+            rich_help_panel="Logging Settings",
+        ),
+        _option(
+            "file_output",
+            Optional[str],
+            None,
+            "--fileoutput",
+            help="Filename to write output to (if not specified, file output is disabled)",
+            rich_help_panel="Output Settings",
+        ),
+        _option(
+            "file_output_dynamic",
+            bool,
+            False,
+            "--fileoutput-dynamic",
+            help="Ignore --fileoutput and write files to the current directory in the format krr-{datetime}.{format} (e.g. krr-20240518223924.csv)",
+            rich_help_panel="Output Settings",
+        ),
+        _option(
+            "slack_output",
+            Optional[str],
+            None,
+            "--slackoutput",
+            help="Send to output to a slack channel, must have SLACK_BOT_TOKEN",
+            rich_help_panel="Output Settings",
+        ),
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _strategy_parameter(field_name: str, annotation: Any, default: Any, help_text: str) -> inspect.Parameter:
+    """Build the parameter of a strategy setting, shared by all the strategies having the same setting."""
+
+    param_decls = dict.fromkeys([f"--{field_name}", f"--{field_name.replace('_', '-')}"])
+    return _option(field_name, annotation, default, *param_decls, help=help_text, rich_help_panel="Strategy Settings")
+
+
+@functools.lru_cache(maxsize=None)
+def _strategy_parameters(settings_type: type[StrategySettings]) -> tuple[inspect.Parameter, ...]:
+    """
+    Build the parameters generated from the settings of a strategy.
+    Cached per settings type, so strategies sharing their settings type share the parameters.
+    """
+
+    parameters = []
+    for field_name, field_meta in _get_strategy_fields(settings_type):
+        args = (
+            field_name,
+            __process_type(field_meta.type_),
+            field_meta.default,
+            f"{field_meta.field_info.description}",
+        )
+        try:
+            parameters.append(_strategy_parameter(*args))
+        except TypeError:  # NOTE: The default value is not hashable, so the parameter can not be cached
+            parameters.append(_strategy_parameter.__wrapped__(*args))
+
+    return tuple(parameters)
+
+
+def _run_strategy(_strategy_name: str, ctx: typer.Context, **kwargs: Any) -> None:
+    """The callback of all the strategy commands, the strategy name is bound with `functools.partial`."""
+
+    from pydantic import ValidationError
+
+    from robusta_krr.core.models.config import Config
+    from robusta_krr.core.runner import Runner
+
+    # NOTE: Everything except the strategy settings is passed to the config as is
+    strategy_parameters = _strategy_parameters(_get_all_strategies()[_strategy_name].get_settings_type())
+    strategy_args = {param.name: kwargs.pop(param.name) for param in strategy_parameters}
+
+    if not kwargs["show_severity"] and kwargs["format"] != "csv":
+        raise click.BadOptionUsage("--exclude-severity", "--exclude-severity works only with format=csv")
+
+    if kwargs.pop("all_clusters"):
+        kwargs["clusters"] = "*"
+    if "*" in kwargs["namespaces"]:
+        kwargs["namespaces"] = "*"
+    if "*" in kwargs["resources"]:
+        kwargs["resources"] = "*"
+
+    try:
+        config = Config(**kwargs, strategy=_strategy_name, other_args=strategy_args)
+        Config.set_config(config)
+    except ValidationError:
+        logging.getLogger("krr").exception("Error occured while parsing arguments")
+    else:
+        runner = Runner()
+        exit_code = _run_async(runner.run())
+        raise typer.Exit(code=exit_code)
+
+
+def load_commands(only: Optional[str] = None) -> None:
+    """Register the strategy commands. If `only` is given, only the command of this strategy is registered."""
+
+    strategies = _get_all_strategies()
+    if only is not None:
+        strategies = {only: strategies[only]}
+
+    for strategy_name, strategy_type in strategies.items():
+        run_strategy = functools.partial(_run_strategy, strategy_name)
+        run_strategy.__signature__ = inspect.Signature(  # type: ignore
+            parameters=(*_common_parameters(), *_strategy_parameters(strategy_type.get_settings_type())),
+            return_annotation=None,
+        )
+        # NOTE: typer reads the type hints of the callback, and a partial does not have them by itself.
+        #       All the annotations are in the signature above.
+        run_strategy.__annotations__ = {}  # type: ignore
+
+        app.command(name=strategy_name, help=_STRATEGY_HELP.format(strategy_name), rich_help_panel="Strategies")(
+            run_strategy
+        )
+
+
+def _completion_args() -> list[str]:
+    """The finished arguments of the command line being completed, without the word under the cursor."""
+
+    # NOTE: typer passes the command line in `_TYPER_COMPLETE_ARGS` (zsh, fish, powershell), click in `COMP_WORDS` (bash)
+    #       In both cases the first word is the program name
+    typer_args = os.environ.get("_TYPER_COMPLETE_ARGS")
+    if typer_args is not None:
+        words = typer_args.split()
+        # NOTE: Unless the line ends with a whitespace, the last word is the one being completed
+        return words[1:] if typer_args[-1:].isspace() else words[1:-1]
+
+    words = os.environ.get("COMP_WORDS", "").split()
+    cword = int(os.environ.get("COMP_CWORD", len(words) - 1))  # NOTE: The index of the word being completed
+    return words[1:cword]
 
 
 def run() -> None:
-    load_commands()
+    # NOTE: `krr version` is answered without building the typer app, the `version` command is kept for the help
+    if sys.argv[1:] == ["version"]:
+        version()
+        return
+
+    # NOTE: Shell completion runs krr on every Tab, with the command line in the environment instead of argv.
+    #       Stubs are enough to complete the strategy names, the options are built only once a strategy name is followed
+    #       by another word (`krr simple<TAB>` must still offer `simple_limit`).
+    args = _completion_args() if os.environ.get("_KRR_COMPLETE") else sys.argv[1:]
+
+    # NOTE: Only the invoked strategy command is built, as building a command requires generating all its options.
+    #       For anything else (`--help`, `version`, unknown commands) the strategies are registered as stubs.
+    command = args[0] if args else None
+    if command in _get_all_strategies():
+        load_commands(only=command)
+    else:
+        load_command_stubs()
+
     app()
 
 
@@ -0,0 +1,14 @@
+import pytest
+
+from robusta_krr.core.abstract import formatters
+
+
+@pytest.mark.parametrize("name", ["json", "pprint", "table", "yaml", "csv", "html"])
+def test_find_builtin_formatter(name: str) -> None:
+    assert name in formatters.list_available()
+    assert formatters.find(name).__display_name__ == name  # type: ignore
+
+
+def test_find_unknown_formatter() -> None:
+    with pytest.raises(ValueError):
+        formatters.find("unknown")
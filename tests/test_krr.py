@@ -1,9 +1,18 @@
+import functools
+import subprocess
+import sys
 import pytest
-from typing import Literal, Union
+import typer
+from pathlib import Path
+from typing import Literal, Optional, Union
 from unittest.mock import patch, Mock, MagicMock
 from typer.testing import CliRunner
 
+from robusta_krr import main
 from robusta_krr.main import app, load_commands
+from robusta_krr.strategies.simple import SimpleStrategySettings
+from robusta_krr.utils.version import get_version
+from robusta_krr.core.abstract.strategies import BaseStrategy
 from robusta_krr.core.integrations.kubernetes import ClusterLoader
 from robusta_krr.core.models.config import settings
 
@@ -11,6 +20,7 @@ runner = CliRunner(mix_stderr=False)
 load_commands()
 
 STRATEGY_NAME = "simple"
+ROOT_DIR = Path(__file__).parent.parent
 
 
 def test_help():
@@ -77,3 +87,151 @@ def test_cluster_namespace_list(
         with patch.object(cluster.core, "list_namespace", return_value=MagicMock(
             items=[MagicMock(**{"metadata.name": m}) for m in cluster_all_ns])):
             assert sorted(cluster.namespaces) == sorted(expected)
+
+
+@pytest.fixture
+def run_app(monkeypatch: pytest.MonkeyPatch) -> typer.Typer:
+    # NOTE: A fresh app for `run()`, as the module level one already has all the strategy commands loaded
+    run_app = typer.Typer(no_args_is_help=True)
+    run_app.command(rich_help_panel="Utils")(main.version)
+    monkeypatch.setattr(main, "app", run_app)
+    return run_app
+
+
+def invoke_run(monkeypatch: pytest.MonkeyPatch, *args: str) -> int:
+    monkeypatch.setattr(sys, "argv", ["krr", *args])
+    with pytest.raises(SystemExit) as exc_info:
+        main.run()
+    return exc_info.value.code
+
+
+def registered_strategies(app: typer.Typer) -> dict:
+    return {command.name: command.callback for command in app.registered_commands if command.name is not None}
+
+
+def test_run_help_registers_stubs(monkeypatch: pytest.MonkeyPatch, run_app: typer.Typer, capsys):
+    assert invoke_run(monkeypatch, "--help") == 0
+    commands = registered_strategies(run_app)
+    assert commands["simple"] is main._strategy_stub and commands["simple_limit"] is main._strategy_stub
+    out = capsys.readouterr().out
+    assert "simple" in out and "simple_limit" in out
+
+
+# NOTE: In a fresh interpreter, as the import order of the modules already loaded by the tests could hide import cycles
+@pytest.mark.parametrize("args", [["--help"], [STRATEGY_NAME, "--help"]])
+def test_krr_help_in_fresh_interpreter(args: list[str]):
+    result = subprocess.run(
+        [sys.executable, str(ROOT_DIR / "krr.py"), *args], cwd=ROOT_DIR, capture_output=True, text=True
+    )
+    assert result.returncode == 0, result.stderr
+    assert STRATEGY_NAME in result.stdout
+
+
+@pytest.mark.parametrize(
+    "code",
+    [
+        "import robusta_krr.api.models",
+        "import robusta_krr.api.strategies",
+        "import robusta_krr.api.formatters",
+        *[
+            f"import runpy; runpy.run_path({str(path)!r}, run_name='example')"
+            for path in sorted((ROOT_DIR / "examples").glob("*.py"))
+        ],
+    ],
+)
+def test_public_api_imports_in_fresh_interpreter(code: str):
+    result = subprocess.run([sys.executable, "-c", code], cwd=ROOT_DIR, capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+
+
+def test_run_strategy_help_builds_only_that_strategy(monkeypatch: pytest.MonkeyPatch, run_app: typer.Typer):
+    assert invoke_run(monkeypatch, STRATEGY_NAME, "--help") == 0
+    commands = registered_strategies(run_app)
+    assert list(commands) == [STRATEGY_NAME]
+    assert isinstance(commands[STRATEGY_NAME], functools.partial)
+
+
+def test_run_unknown_command(monkeypatch: pytest.MonkeyPatch, run_app: typer.Typer):
+    assert invoke_run(monkeypatch, "unknown") == 2
+
+
+def test_run_version(monkeypatch: pytest.MonkeyPatch, run_app: typer.Typer, capsys):
+    monkeypatch.setattr(sys, "argv", ["krr", "version"])
+    with patch("robusta_krr.main.load_commands") as mock_load_commands, patch(
+        "robusta_krr.main.load_command_stubs"
+    ) as mock_load_command_stubs:
+        main.run()
+
+    mock_load_commands.assert_not_called()
+    mock_load_command_stubs.assert_not_called()
+    assert capsys.readouterr().out.strip() == get_version()
+
+
+# NOTE: Called directly, as pydantic's `field_meta.type_` passed by the strategy commands is already without Optional
+@pytest.mark.parametrize(
+    "_T,expected",
+    [
+        (Optional[int], Optional[int]),
+        (Optional[float], Optional[float]),
+        (int, int),
+        (dict[str, int], str),
+    ],
+)
+def test_process_type(_T: type, expected: type):
+    assert getattr(main, "__process_type")(_T) == expected
+
+
+def test_clear_caches_picks_up_new_strategies(run_app: typer.Typer):
+    load_commands()
+
+    class CacheTestStrategy(BaseStrategy[SimpleStrategySettings]):
+        display_name = "cache_test"
+        metrics = []
+
+        def run(self, history_data, object_data):
+            return {}
+
+    try:
+        assert "cache_test" not in registered_strategies(run_app)
+        main.clear_caches()
+        load_commands()
+        assert "cache_test" in registered_strategies(run_app)
+    finally:
+        main.clear_caches()
+
+
+@pytest.mark.parametrize(
+    "completion_env",
+    [
+        {"_KRR_COMPLETE": "complete_bash", "COMP_WORDS": "krr simple", "COMP_CWORD": "1"},
+        {"_KRR_COMPLETE": "complete_zsh", "_TYPER_COMPLETE_ARGS": "krr simple"},
+    ],
+)
+def test_run_completion_of_strategy_names(
+    monkeypatch: pytest.MonkeyPatch, run_app: typer.Typer, capsys, completion_env: dict[str, str]
+):
+    for name in ["_TYPER_COMPLETE_ARGS", "COMP_WORDS", "COMP_CWORD"]:
+        monkeypatch.delenv(name, raising=False)
+    for name, value in completion_env.items():
+        monkeypatch.setenv(name, value)
+
+    assert invoke_run(monkeypatch) == 0
+    out = capsys.readouterr().out
+    assert "simple" in out and "simple_limit" in out
+
+
+@pytest.mark.parametrize(
+    "completion_env",
+    [
+        {"COMP_WORDS": "krr simple ", "COMP_CWORD": "2"},
+        {"_TYPER_COMPLETE_ARGS": "krr simple "},
+        {"_TYPER_COMPLETE_ARGS": "krr simple --for"},
+    ],
+)
+def test_completion_args_after_strategy_name(monkeypatch: pytest.MonkeyPatch, completion_env: dict[str, str]):
+    for name in ["_TYPER_COMPLETE_ARGS", "COMP_WORDS", "COMP_CWORD"]:
+        monkeypatch.delenv(name, raising=False)
+    for name, value in completion_env.items():
+        monkeypatch.setenv(name, value)
+
+    assert main._completion_args() == ["simple"]